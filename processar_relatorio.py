@@ -3,6 +3,7 @@ from datetime import datetime
 import os
 import glob
 import warnings
+from script import paginar_resultados
 
 # Suprime os warnings do openpyxl
 warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
@@ -199,9 +200,12 @@ def gerar_analise_recebimentos_tarifas(df, f=None):
     else:
         print("\n".join(output))
 
-def gerar_operacoes_nao_pareadas(df, f=None):
+def obter_operacoes_nao_pareadas(df):
     """
-    Gera a lista de operações não pareadas.
+    Seleciona recebimentos sem tarifa e tarifas sem recebimento correspondente.
+    
+    Returns:
+        DataFrame: Operações não pareadas, com a coluna 'Categoria' indicando o grupo
     """
     recebimentos = df[df['Tipo'] == 'Recebimento']
     tarifas = df[df['Tipo'] == 'Tarifa do Mercado Pago']
@@ -214,17 +218,35 @@ def gerar_operacoes_nao_pareadas(df, f=None):
     recebimentos_nao_pareados = recebimentos_com_relacao[~recebimentos_com_relacao['Operacao_Relacionada'].isin(operacoes_completas)]
     tarifas_nao_pareadas = tarifas_com_relacao[~tarifas_com_relacao['Operacao_Relacionada'].isin(operacoes_completas)]
     
+    return pd.concat([
+        recebimentos_nao_pareados.assign(Categoria='Recebimento sem tarifa'),
+        tarifas_nao_pareadas.assign(Categoria='Tarifa sem recebimento')
+    ])
+
+def formatar_operacao_nao_pareada(row):
+    """Formata uma operação de obter_operacoes_nao_pareadas em uma linha."""
+    valor = abs(row['Valor']) if row['Categoria'] == 'Tarifa sem recebimento' else row['Valor']
+    return f"Data: {row['Data'].strftime('%d/%m/%Y')} - Movimento {row['Descrição']} - Operação Relacionada: {row['Operacao_Relacionada']} - Valor: R$ {valor:.2f}"
+
+def gerar_operacoes_nao_pareadas(df, f=None):
+    """
+    Gera a lista de operações não pareadas.
+    """
+    nao_pareadas = obter_operacoes_nao_pareadas(df)
+    recebimentos_nao_pareados = nao_pareadas[nao_pareadas['Categoria'] == 'Recebimento sem tarifa']
+    tarifas_nao_pareadas = nao_pareadas[nao_pareadas['Categoria'] == 'Tarifa sem recebimento']
+    
     output = ["=== OPERAÇÕES NÃO PAREADAS ===\n"]
     
     if len(recebimentos_nao_pareados) > 0:
         output.append("\nRecebimentos sem Tarifa Correspondente:")
         for _, row in recebimentos_nao_pareados.iterrows():
-            output.append(f"Data: {row['Data'].strftime('%d/%m/%Y')} - Movimento {row['Descrição']} - Operação Relacionada: {row['Operacao_Relacionada']} - Valor: R$ {row['Valor']:.2f}")
+            output.append(formatar_operacao_nao_pareada(row))
     
     if len(tarifas_nao_pareadas) > 0:
         output.append("\nTarifas sem Recebimento Correspondente:")
         for _, row in tarifas_nao_pareadas.iterrows():
-            output.append(f"Data: {row['Data'].strftime('%d/%m/%Y')} - Movimento {row['Descrição']} - Operação Relacionada: {row['Operacao_Relacionada']} - Valor: R$ {abs(row['Valor']):.2f}")
+            output.append(formatar_operacao_nao_pareada(row))
     
     if f:
         f.write("\n".join(output))
@@ -382,8 +404,11 @@ def processar_relatorio(caminho_arquivo=None):
                 gerar_analise_recebimentos_tarifas(df)
                 input(f"\n{Cores.AZUL}Pressione Enter para continuar...{Cores.RESET}")
             elif opcao == '3':
-                gerar_operacoes_nao_pareadas(df)
-                input(f"\n{Cores.AZUL}Pressione Enter para continuar...{Cores.RESET}")
+                paginar_resultados(
+                    obter_operacoes_nao_pareadas(df),
+                    lambda row: f"[{row['Categoria']}] {formatar_operacao_nao_pareada(row)}",
+                    "=== OPERAÇÕES NÃO PAREADAS ==="
+                )
             elif opcao == '4':
                 gerar_detalhes_por_tipo(df)
                 input(f"\n{Cores.AZUL}Pressione Enter para continuar...{Cores.RESET}")
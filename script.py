@@ -1,12 +1,17 @@
 import pandas as pd
+import numpy as np
 from datetime import datetime
 import os
 import glob
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 
 # Suprime os warnings do openpyxl
 warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
 
+NANOSSEGUNDOS_POR_DIA = 86400 * 10**9
+
 # Códigos de cores ANSI
 class Cores:
     VERDE = '\033[92m'
@@ -110,8 +115,10 @@ def exibir_menu():
     print(f"{Cores.VERDE}(2) Recebimentos e tarifas (Resumo financeiro){Cores.RESET}")
     print(f"{Cores.VERDE}(3) Detalhes por tipo de operação{Cores.RESET}")
     print(f"{Cores.VERDE}(4) Entradas maiores que R$ 59,00{Cores.RESET}")
+    print(f"{Cores.VERDE}(5) Auditoria de taxas de tarifa{Cores.RESET}")
+    print(f"{Cores.VERDE}(6) Fluxo de caixa diário{Cores.RESET}")
     print(f"{Cores.AMARELO}....................................{Cores.RESET}")
-    print(f"{Cores.VERDE}(5) Gerar relatório completo{Cores.RESET}")
+    print(f"{Cores.VERDE}(7) Gerar relatório completo{Cores.RESET}")
     print(f"{Cores.AMARELO}....................................{Cores.RESET}")
     print(f"{Cores.VERMELHO}(0) Sair{Cores.RESET}")
 
@@ -192,43 +199,60 @@ def gerar_detalhes_por_tipo(df, f=None):
     else:
         print("\n".join(output))
 
-def analisar_entradas_maiores(df, f=None):
+def obter_entradas_maiores(df, valor_minimo=59):
     """
-    Analisa entradas com valor maior que R$ 59,00, excluindo tarifas.
-    Mostra detalhes como data, valor, tarifa relacionada (se houver) e outras informações relevantes.
+    Seleciona as entradas acima do valor mínimo (excluindo tarifas), já com a
+    tarifa relacionada e o valor líquido.
+    
+    Returns:
+        DataFrame: Entradas ordenadas por valor (do maior para o menor), com as
+            colunas 'Tarifa' e 'Valor_Liquido' vazias quando não há tarifa
     """
-    # Filtra entradas maiores que R$ 59,00 e que não são tarifas
+    # Filtra entradas maiores que o valor mínimo e que não são tarifas
     entradas_maiores = df[
-        (df['Valor'] > 59) & 
+        (df['Valor'] > valor_minimo) & 
         (df['Tipo'] != 'Tarifa do Mercado Pago')
     ].copy()
     
     # Ordena por valor (do maior para o menor)
     entradas_maiores = entradas_maiores.sort_values('Valor', ascending=False)
     
+    # Primeira tarifa de cada operação relacionada
+    tarifas = df[(df['Tipo'] == 'Tarifa do Mercado Pago') & (df['Operacao_Relacionada'].notna())]
+    tarifas = tarifas.drop_duplicates('Operacao_Relacionada').set_index('Operacao_Relacionada')['Valor']
+    
+    entradas_maiores['Tarifa'] = entradas_maiores['Operacao_Relacionada'].map(tarifas).abs()
+    entradas_maiores['Valor_Liquido'] = entradas_maiores['Valor'] - entradas_maiores['Tarifa']
+    return entradas_maiores
+
+def formatar_entrada_maior(entrada):
+    """Formata uma entrada de obter_entradas_maiores em uma linha do paginador."""
+    linha = f"{entrada['Data'].strftime('%d/%m/%Y %H:%M:%S')} | {entrada['Tipo']} | Movimento {entrada['Descrição']} | R$ {entrada['Valor']:.2f}"
+    if pd.notna(entrada['Tarifa']):
+        linha += f" | Tarifa R$ {entrada['Tarifa']:.2f} | Líquido R$ {entrada['Valor_Liquido']:.2f}"
+    return linha
+
+def analisar_entradas_maiores(df, f=None):
+    """
+    Analisa entradas com valor maior que R$ 59,00, excluindo tarifas.
+    Mostra detalhes como data, valor, tarifa relacionada (se houver) e outras informações relevantes.
+    """
+    entradas_maiores = obter_entradas_maiores(df)
+    
     output = [
         "=== ANÁLISE DE ENTRADAS MAIORES QUE R$ 59,00 ===\n",
         f"Total de entradas encontradas: {len(entradas_maiores)}\n"
     ]
     
-    # Para cada entrada, procura a tarifa relacionada (se houver)
     for _, entrada in entradas_maiores.iterrows():
         output.append(f"\nData: {entrada['Data'].strftime('%d/%m/%Y %H:%M:%S')}")
         output.append(f"Tipo: {entrada['Tipo']}")
         output.append(f"Movimento: {entrada['Descrição']}")
         output.append(f"Valor: R$ {entrada['Valor']:.2f}")
         
-        # Procura tarifa relacionada
-        if pd.notna(entrada['Operacao_Relacionada']):
-            tarifa_relacionada = df[
-                (df['Tipo'] == 'Tarifa do Mercado Pago') & 
-                (df['Operacao_Relacionada'] == entrada['Operacao_Relacionada'])
-            ]
-            
-            if not tarifa_relacionada.empty:
-                tarifa = tarifa_relacionada.iloc[0]
-                output.append(f"Tarifa Relacionada: R$ {abs(tarifa['Valor']):.2f}")
-                output.append(f"Valor Líquido: R$ {(entrada['Valor'] - abs(tarifa['Valor'])):.2f}")
+        if pd.notna(entrada['Tarifa']):
+            output.append(f"Tarifa Relacionada: R$ {entrada['Tarifa']:.2f}")
+            output.append(f"Valor Líquido: R$ {entrada['Valor_Liquido']:.2f}")
         
         output.append("-" * 50)
     
@@ -245,6 +269,623 @@ def analisar_entradas_maiores(df, f=None):
     else:
         print("\n".join(output))
 
+class SketchKLL:
+    """
+    Sketch KLL para quantis aproximados em fluxo.
+    
+    Guarda O(k) valores independentemente de quantos forem adicionados, e
+    dois sketches podem ser mesclados (por exemplo, um por arquivo ou por
+    processo). A compactação alterna entre manter os itens pares e ímpares
+    em cada nível, em vez de sortear, para que o mesmo arquivo sempre gere
+    os mesmos quantis. Com isso não vale a garantia probabilística de erro
+    do KLL original: o erro de posição fica em torno de 1% com k=200 em
+    dados comuns, mas uma ordem de chegada adversa pode piorá-lo.
+    """
+    
+    def __init__(self, k=200):
+        self.k = k
+        self.n = 0
+        self.niveis = [np.empty(0)]
+        self._deslocamentos = [0]
+    
+    def _capacidade(self, nivel):
+        # Níveis mais baixos (itens de menor peso) guardam menos valores
+        altura = len(self.niveis) - nivel - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** altura)))
+    
+    def _compactar(self):
+        nivel = 0
+        while nivel < len(self.niveis):
+            itens = self.niveis[nivel]
+            if len(itens) <= self._capacidade(nivel):
+                nivel += 1
+                continue
+            if nivel + 1 == len(self.niveis):
+                self.niveis.append(np.empty(0))
+                self._deslocamentos.append(0)
+            
+            # Promove metade dos itens (pares ou ímpares, alternando) com o dobro do peso
+            itens = np.sort(itens)
+            sobra = len(itens) % 2
+            deslocamento = self._deslocamentos[nivel]
+            self._deslocamentos[nivel] = 1 - deslocamento
+            promovidos = itens[deslocamento:len(itens) - sobra:2]
+            self.niveis[nivel + 1] = np.concatenate([self.niveis[nivel + 1], promovidos])
+            self.niveis[nivel] = itens[len(itens) - sobra:]
+            nivel = 0
+    
+    def adicionar(self, valores):
+        """Adiciona um lote de valores (valores ausentes são ignorados)."""
+        valores = np.asarray(valores, dtype=float).ravel()
+        valores = valores[~np.isnan(valores)]
+        self.niveis[0] = np.concatenate([self.niveis[0], valores])
+        self.n += len(valores)
+        self._compactar()
+    
+    def mesclar(self, outro):
+        """Incorpora outro sketch a este."""
+        while len(self.niveis) < len(outro.niveis):
+            self.niveis.append(np.empty(0))
+            self._deslocamentos.append(0)
+        for nivel, itens in enumerate(outro.niveis):
+            self.niveis[nivel] = np.concatenate([self.niveis[nivel], itens])
+        self.n += outro.n
+        self._compactar()
+    
+    def quantis(self, qs):
+        """
+        Estima os quantis pedidos.
+        
+        Args:
+            qs (list): Frações entre 0 e 1 (ex.: [0.5, 0.9, 0.99])
+            
+        Returns:
+            list: Valores estimados (NaN se o sketch estiver vazio)
+        """
+        if self.n == 0:
+            return [float('nan')] * len(qs)
+        valores = np.concatenate(self.niveis)
+        pesos = np.concatenate([np.full(len(itens), 2 ** nivel) for nivel, itens in enumerate(self.niveis)])
+        ordem = np.argsort(valores, kind='stable')
+        acumulado = np.cumsum(pesos[ordem])
+        posicoes = np.searchsorted(acumulado, np.asarray(qs) * acumulado[-1], side='left')
+        return [float(v) for v in valores[ordem][np.minimum(posicoes, len(valores) - 1)]]
+
+FAIXAS_VALOR = [0, 20, 59, 200, np.inf]
+NOMES_FAIXAS = ['Até R$ 20,00', 'R$ 20,00 a R$ 59,00', 'R$ 59,00 a R$ 200,00', 'Acima de R$ 200,00']
+
+def calcular_taxas_tarifas(df):
+    """
+    Calcula a taxa de tarifa (tarifa / recebimento) de cada operação pareada.
+    
+    Returns:
+        DataFrame: Uma linha por operação relacionada, com 'Data' (dia do
+            recebimento), 'Recebimento', 'Tarifa', 'Taxa' e 'Faixa'
+    """
+    pares = df[
+        df['Tipo'].isin(['Recebimento', 'Tarifa do Mercado Pago']) &
+        df['Operacao_Relacionada'].notna()
+    ]
+    e_recebimento = pares['Tipo'] == 'Recebimento'
+    
+    recebimentos = pares[e_recebimento].groupby('Operacao_Relacionada').agg(
+        Data=('Data', 'min'), Recebimento=('Valor', 'sum')
+    )
+    tarifas = pares[~e_recebimento].groupby('Operacao_Relacionada')['Valor'].sum().abs().rename('Tarifa')
+    
+    # Só operações com recebimento e tarifa entram na auditoria
+    taxas = recebimentos.join(tarifas, how='inner')
+    taxas = taxas[taxas['Recebimento'] > 0]
+    taxas['Data'] = taxas['Data'].dt.normalize()
+    taxas['Taxa'] = taxas['Tarifa'] / taxas['Recebimento']
+    taxas['Faixa'] = pd.cut(taxas['Recebimento'], FAIXAS_VALOR, labels=NOMES_FAIXAS, right=False)
+    return taxas
+
+def acumular_sketches_tarifas(taxas, sketches=None):
+    """
+    Alimenta os sketches de taxa de tarifa (geral, por dia e por faixa de valor).
+    
+    Pode ser chamada arquivo a arquivo com o mesmo dict para auditar vários
+    extratos sem guardar todas as taxas em memória.
+    
+    Args:
+        taxas (DataFrame): Retorno de calcular_taxas_tarifas
+        sketches (dict): Sketches acumulados anteriormente (opcional)
+        
+    Returns:
+        dict: {'geral': SketchKLL, 'por_dia': {data: SketchKLL}, 'por_faixa': {faixa: SketchKLL}}
+    """
+    if sketches is None:
+        sketches = {'geral': SketchKLL(), 'por_dia': {}, 'por_faixa': {}}
+    
+    sketches['geral'].adicionar(taxas['Taxa'])
+    for dia, grupo in taxas.groupby('Data')['Taxa']:
+        sketches['por_dia'].setdefault(dia, SketchKLL()).adicionar(grupo)
+    for faixa, grupo in taxas.groupby('Faixa', observed=True)['Taxa']:
+        sketches['por_faixa'].setdefault(faixa, SketchKLL()).adicionar(grupo)
+    return sketches
+
+# Tarifas são arredondadas ao centavo, então diferenças até este valor não indicam mudança de preço
+TOLERANCIA_ARREDONDAMENTO = 0.01
+
+def sinalizar_taxas_fora_do_padrao(taxas, sketch_geral):
+    """
+    Seleciona as operações com taxa de tarifa fora do padrão.
+    
+    O limite é [p25 - 3*IQR, p75 + 3*IQR], com os quartis estimados pelo
+    sketch geral. Como a maioria das operações paga a mesma taxa, o IQR pode
+    ser quase zero; por isso cada operação tem também uma folga mínima de
+    R$ 0,01 na tarifa (0,01 / recebimento na taxa), para que o simples
+    arredondamento ao centavo não seja sinalizado.
+    
+    Returns:
+        DataFrame: Operações sinalizadas, da maior para a menor diferença (em
+            reais) entre a tarifa cobrada e a tarifa pela taxa mediana
+    """
+    p25, p50, p75 = sketch_geral.quantis([0.25, 0.5, 0.75])
+    folga = np.maximum(3 * (p75 - p25), TOLERANCIA_ARREDONDAMENTO / taxas['Recebimento'])
+    
+    fora_do_padrao = taxas[(taxas['Taxa'] < p25 - folga) | (taxas['Taxa'] > p75 + folga)]
+    fora_do_padrao = fora_do_padrao.assign(Desvio=(fora_do_padrao['Tarifa'] - p50 * fora_do_padrao['Recebimento']).abs())
+    return fora_do_padrao.sort_values('Desvio', ascending=False)
+
+def gerar_auditoria_tarifas(df, f=None, sketches=None, limite_outliers=50):
+    """
+    Gera a auditoria da taxa de tarifa por operação (p50/p90/p99 por dia e por
+    faixa de valor) e sinaliza as operações fora do padrão
+    (ver sinalizar_taxas_fora_do_padrao).
+    """
+    taxas = calcular_taxas_tarifas(df)
+    sketches = acumular_sketches_tarifas(taxas, sketches)
+    
+    def formatar_quantis(sketch):
+        p50, p90, p99 = sketch.quantis([0.5, 0.9, 0.99])
+        return f"p50 {p50 * 100:.2f}% | p90 {p90 * 100:.2f}% | p99 {p99 * 100:.2f}% ({sketch.n} operações)"
+    
+    output = [
+        "=== AUDITORIA DE TAXAS DE TARIFA ===\n",
+        f"Operações pareadas neste arquivo: {len(taxas)}",
+        f"Operações pareadas acumuladas (base dos quantis): {sketches['geral'].n}"
+    ]
+    
+    if sketches['geral'].n == 0:
+        output.append("Nenhuma operação pareada (recebimento e tarifa) encontrada.")
+    else:
+        output.append(f"Geral: {formatar_quantis(sketches['geral'])}\n")
+        output.append("Por faixa de valor do recebimento:")
+        for faixa in NOMES_FAIXAS:
+            if faixa in sketches['por_faixa']:
+                output.append(f"  {faixa}: {formatar_quantis(sketches['por_faixa'][faixa])}")
+        
+        output.append("\nPor dia:")
+        for dia in sorted(sketches['por_dia']):
+            output.append(f"  {dia.strftime('%d/%m/%Y')}: {formatar_quantis(sketches['por_dia'][dia])}")
+        
+        # Sinaliza operações fora do padrão
+        fora_do_padrao = sinalizar_taxas_fora_do_padrao(taxas, sketches['geral'])
+        
+        output.append(f"\nOperações fora do padrão: {len(fora_do_padrao)}")
+        if len(fora_do_padrao) > 0:
+            p25, p75 = sketches['geral'].quantis([0.25, 0.75])
+            iqr = p75 - p25
+            output.append(f"(taxa fora de {max(p25 - 3 * iqr, 0) * 100:.2f}% a {(p75 + 3 * iqr) * 100:.2f}%, com folga mínima de R$ 0,01 na tarifa)")
+        for operacao, row in fora_do_padrao.head(limite_outliers).iterrows():
+            output.append(f"Data: {row['Data'].strftime('%d/%m/%Y')} - Operação Relacionada: {operacao} - Recebimento: R$ {row['Recebimento']:.2f} - Tarifa: R$ {row['Tarifa']:.2f} - Taxa: {row['Taxa'] * 100:.2f}%")
+        if len(fora_do_padrao) > limite_outliers:
+            output.append(f"... e mais {len(fora_do_padrao) - limite_outliers} operações")
+    
+    if f:
+        f.write("\n".join(output))
+    else:
+        print("\n".join(output))
+
+# Prefixos dos tipos de saída (ex.: 'Transferência via Pix', 'Pagamento com desconto recebido')
+TIPOS_SAIDA_CAIXA = ('Saque', 'Transferência', 'Pagamento')
+
+def calcular_fluxo_diario(df):
+    """
+    Monta a série diária de caixa sobre um calendário contínuo.
+    
+    Dias sem movimento entram com zero. As somas por dia são feitas com
+    np.bincount sobre o índice do dia, sem agrupar nem iterar linha a linha.
+    
+    'Liquido' é recebimentos menos tarifas e saídas; 'Saldo' é o acumulado de
+    todos os valores do extrato (inclusive impostos, rendimentos e adições),
+    ou seja, a variação do saldo da conta desde o início do período.
+    
+    Returns:
+        DataFrame: Indexado por dia ('Data'), com 'Operacoes', 'Recebimentos',
+            'Tarifas', 'Saidas', 'Liquido', 'Saldo' e as somas e médias móveis de 7 e 30
+            dias do valor líquido (vazias até a janela ter todos os dias)
+    """
+    df = df[df['Data'].notna()]
+    if df.empty:
+        return pd.DataFrame(columns=[
+            'Operacoes', 'Recebimentos', 'Tarifas', 'Saidas', 'Liquido', 'Saldo',
+            'Soma_7d', 'Media_7d', 'Soma_30d', 'Media_30d'
+        ], index=pd.DatetimeIndex([], name='Data'))
+    
+    dias = df['Data'].dt.normalize().to_numpy()
+    inicio = dias.min()
+    posicao = (dias - inicio) // np.timedelta64(1, 'D')
+    calendario = pd.date_range(inicio, dias.max(), freq='D', name='Data')
+    
+    valores = pd.to_numeric(df['Valor'], errors='coerce').fillna(0).to_numpy()
+    tipos = df['Tipo'].to_numpy()
+    
+    def somar_por_dia(mascara):
+        return np.bincount(posicao[mascara], weights=valores[mascara], minlength=len(calendario))
+    
+    fluxo = pd.DataFrame({
+        'Operacoes': np.bincount(posicao, minlength=len(calendario)),
+        'Recebimentos': somar_por_dia(tipos == 'Recebimento'),
+        'Tarifas': np.abs(somar_por_dia(tipos == 'Tarifa do Mercado Pago')),
+        'Saidas': np.abs(somar_por_dia(pd.Series(tipos).str.startswith(TIPOS_SAIDA_CAIXA, na=False).to_numpy()))
+    }, index=calendario)
+    
+    fluxo['Liquido'] = fluxo['Recebimentos'] - fluxo['Tarifas'] - fluxo['Saidas']
+    fluxo['Saldo'] = somar_por_dia(np.ones(len(valores), dtype=bool)).cumsum()
+    
+    for janela in (7, 30):
+        movel = fluxo['Liquido'].rolling(janela, min_periods=janela)
+        fluxo[f'Soma_{janela}d'] = movel.sum()
+        fluxo[f'Media_{janela}d'] = movel.mean()
+    
+    return fluxo
+
+def formatar_dia_fluxo(dia):
+    """Formata uma linha de calcular_fluxo_diario (com 'Data' como coluna)."""
+    def formatar_media(valor):
+        # Janelas incompletas no início do período não têm média
+        return "-" if pd.isna(valor) else f"R$ {valor:.2f}"
+    
+    return (
+        f"{dia['Data'].strftime('%d/%m/%Y')} - Recebimentos: R$ {dia['Recebimentos']:.2f} - "
+        f"Tarifas: R$ {dia['Tarifas']:.2f} - Saídas: R$ {dia['Saidas']:.2f} - "
+        f"Líquido: R$ {dia['Liquido']:.2f} - Saldo: R$ {dia['Saldo']:.2f} - "
+        f"Média 7d: {formatar_media(dia['Media_7d'])} - Média 30d: {formatar_media(dia['Media_30d'])}"
+    )
+
+def gerar_fluxo_caixa_diario(df, f=None):
+    """
+    Gera o fluxo de caixa diário com saldo acumulado e médias móveis.
+    """
+    fluxo = calcular_fluxo_diario(df)
+    
+    output = ["=== FLUXO DE CAIXA DIÁRIO ===\n"]
+    
+    if fluxo.empty:
+        output.append("Nenhuma operação com data encontrada.")
+    else:
+        output.extend([
+            f"Período: {fluxo.index[0].strftime('%d/%m/%Y')} a {fluxo.index[-1].strftime('%d/%m/%Y')} ({len(fluxo)} dias)",
+            f"Dias sem movimento: {int((fluxo['Operacoes'] == 0).sum())}",
+            f"Variação do Saldo no Período: R$ {fluxo['Saldo'].iloc[-1]:.2f}",
+            f"Maior Saldo Acumulado: R$ {fluxo['Saldo'].max():.2f} em {fluxo['Saldo'].idxmax().strftime('%d/%m/%Y')}",
+            f"Menor Saldo Acumulado: R$ {fluxo['Saldo'].min():.2f} em {fluxo['Saldo'].idxmin().strftime('%d/%m/%Y')}\n"
+        ])
+        output.extend(formatar_dia_fluxo(dia) for _, dia in fluxo.reset_index().iterrows())
+    
+    if f:
+        f.write("\n".join(output))
+    else:
+        print("\n".join(output))
+
+def exportar_fluxo_diario(fluxo, caminho_csv):
+    """
+    Exporta a série de calcular_fluxo_diario em CSV (separador ';' e vírgula
+    decimal, para abrir direto no Excel em português).
+    """
+    fluxo.to_csv(caminho_csv, sep=';', decimal=',', float_format='%.2f', date_format='%d/%m/%Y', encoding='utf-8-sig')
+
+def _chaves_busca(serie):
+    """Converte uma coluna de IDs em texto sem casas decimais (ex.: 1137.0 -> '1137')."""
+    numeros = pd.to_numeric(serie, errors='coerce')
+    chaves = serie.astype(str).to_numpy(dtype=object)
+    inteiros = numeros.notna() & (numeros % 1 == 0)
+    chaves[inteiros.to_numpy()] = numeros[inteiros].astype('int64').astype(str).to_numpy()
+    return pd.Index(chaves)
+
+def paginar_resultados(resultado, formatar_linha, titulo, linhas_por_pagina=20, coluna_valor='Valor', colunas_busca=('Descrição', 'Operacao_Relacionada'), valor_absoluto=True):
+    """
+    Exibe um DataFrame de resultados em páginas no terminal.
+    
+    Só as linhas da página atual são formatadas; a ordenação por data, a
+    ordenação por valor e o índice de busca são montados na primeira vez em
+    que o comando correspondente é usado, então a primeira tela aparece no
+    mesmo tempo independentemente do tamanho do resultado.
+    
+    Comandos:
+        Enter / s          próxima página
+        a                  página anterior
+        d dd/mm/aaaa       vai para a primeira operação da data
+        b termo            filtra por movimento (Descrição) ou operação relacionada
+        v                  ordena por valor (alterna maior/menor primeiro)
+        l                  limpa busca e ordenação
+        0                  sair
+    
+    Args:
+        resultado (DataFrame): Linhas a exibir, com a coluna 'Data'
+        formatar_linha (callable): Recebe uma linha (Series) e devolve o texto
+        titulo (str): Cabeçalho exibido em cada página
+        linhas_por_pagina (int): Quantidade de linhas por página
+        coluna_valor (str): Coluna usada na ordenação por valor
+        valor_absoluto (bool): Se True, ordena pelo módulo do valor (saídas e
+            entradas grandes juntas); se False, pelo valor com sinal
+        colunas_busca (tuple): Colunas de IDs usadas na busca (vazia desativa a busca)
+    """
+    total = len(resultado)
+    ordem_original = np.arange(total)
+    ordem = ordem_original
+    cache = {}
+    inicio = 0
+    mensagem = ""
+    
+    while True:
+        limpar_tela()
+        pagina = resultado.iloc[ordem[inicio:inicio + linhas_por_pagina]]
+        pagina_atual = -(-inicio // linhas_por_pagina) + 1
+        total_paginas = max(1, -(-len(ordem) // linhas_por_pagina))
+        
+        print(f"{Cores.AZUL}{titulo}{Cores.RESET}")
+        print(f"{Cores.AMARELO}Página {min(pagina_atual, total_paginas)}/{total_paginas} - linhas {min(inicio + 1, len(ordem))}-{inicio + len(pagina)} de {len(ordem)} ({total} no total){Cores.RESET}\n")
+        for _, linha in pagina.iterrows():
+            print(formatar_linha(linha))
+        if mensagem:
+            print(f"\n{Cores.VERMELHO}{mensagem}{Cores.RESET}")
+            mensagem = ""
+        
+        comando = input(f"\n{Cores.VERDE}[Enter] próxima  [a] anterior  [d data]  [b busca]  [v] valor  [l] limpar  [0] sair: {Cores.RESET}").strip()
+        acao, _, argumento = comando.partition(' ')
+        acao = acao.lower()
+        argumento = argumento.strip()
+        
+        if acao == '0':
+            return
+        elif acao in ('', 's'):
+            if inicio + linhas_por_pagina < len(ordem):
+                inicio += linhas_por_pagina
+        elif acao == 'a':
+            inicio = max(0, inicio - linhas_por_pagina)
+        elif acao == 'd':
+            try:
+                data = pd.to_datetime(argumento, dayfirst=True)
+                if pd.isna(data):
+                    raise ValueError(argumento)
+                data = np.datetime64(data)
+            except (ValueError, TypeError, OverflowError):
+                mensagem = "Data inválida! Use o formato dd/mm/aaaa."
+                continue
+            if 'datas' not in cache:
+                cache['datas'] = resultado['Data'].to_numpy()
+            # O salto por data reordena as linhas visíveis cronologicamente
+            datas = cache['datas']
+            ordem = ordem[np.argsort(datas[ordem], kind='stable')]
+            posicao = np.searchsorted(datas[ordem], data, side='left')
+            # A página começa exatamente na data pedida
+            inicio = min(posicao, max(0, len(ordem) - 1))
+        elif acao == 'b':
+            if not colunas_busca:
+                mensagem = "Busca indisponível para esta lista."
+                continue
+            if 'indices' not in cache:
+                cache['indices'] = [_chaves_busca(resultado[coluna]) for coluna in colunas_busca]
+            encontrados = np.unique(np.concatenate([indice.get_indexer_for([argumento]) for indice in cache['indices']]))
+            encontrados = encontrados[encontrados >= 0]
+            if len(encontrados) == 0:
+                mensagem = f"Nenhuma linha encontrada para '{argumento}'."
+                continue
+            ordem = encontrados
+            inicio = 0
+        elif acao == 'v':
+            if 'por_valor' not in cache:
+                valores = resultado[coluna_valor].to_numpy(dtype=float)
+                if valor_absoluto:
+                    valores = np.abs(valores)
+                cache['por_valor'] = np.argsort(-valores, kind='stable')
+            decrescente = not cache.get('decrescente', False)
+            cache['decrescente'] = decrescente
+            ordenada = cache['por_valor'] if decrescente else cache['por_valor'][::-1]
+            # Mantém o filtro de busca ativo, se houver
+            if len(ordem) < total:
+                ordenada = ordenada[np.isin(ordenada, ordem)]
+            ordem = ordenada
+            inicio = 0
+        elif acao == 'l':
+            ordem = ordem_original
+            inicio = 0
+        else:
+            mensagem = "Comando inválido!"
+
+def carregar_relatorio(caminho_arquivo, compartilhar=False):
+    """
+    Lê o arquivo Excel e normaliza as colunas usadas nas análises.
+    
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo Excel
+        compartilhar (bool): Se True, também publica as colunas numéricas em
+            memória compartilhada para análises em vários processos
+        
+    Returns:
+        DataFrame: Dados com as colunas renomeadas e a data convertida.
+            Com compartilhar=True, retorna um ColunasCompartilhadas (usar com
+            `with`), cujo atributo `df` contém esses mesmos dados.
+    """
+    df = pd.read_excel(caminho_arquivo)
+    
+    # Renomeia as colunas para facilitar o acesso
+    df = df.rename(columns={
+        'Data de pagamento': 'Data',
+        'Tipo de operação': 'Tipo',
+        'Número do movimento': 'Descrição',
+        'Operação relacionada': 'Operacao_Relacionada',
+        'Valor': 'Valor'
+    })
+    
+    # Converte a coluna de data para datetime
+    df['Data'] = pd.to_datetime(df['Data'])
+    
+    if compartilhar:
+        return ColunasCompartilhadas(df)
+    return df
+
+class ColunasCompartilhadas:
+    """
+    Colunas numéricas normalizadas em blocos de memória compartilhada.
+    
+    As linhas são ordenadas por data, de modo que cada período corresponde a uma
+    fatia contínua dos arrays. Colunas gravadas:
+        - Valor: centavos (int64)
+        - Data: nanossegundos desde a época (int64)
+        - Tipo: código inteiro (int16), com os nomes em 'tipos'
+        - Descrição e Operacao_Relacionada: IDs (int64), -1 quando ausente
+    
+    Os blocos pertencem a este objeto e são removidos ao sair do bloco `with`
+    (ou em liberar()). Só o `descritor` (nomes, dtypes, tamanho e tipos) é
+    enviado aos processos filhos; o DataFrame de origem fica em `df`.
+    """
+    
+    def __init__(self, df):
+        self.df = df
+        df = df.sort_values('Data', kind='stable')
+        codigos, tipos = pd.factorize(df['Tipo'])
+        
+        arrays = {
+            'Valor': np.rint(pd.to_numeric(df['Valor'], errors='coerce').fillna(0).to_numpy() * 100).astype(np.int64),
+            'Data': df['Data'].to_numpy(dtype='datetime64[ns]').view(np.int64),
+            'Tipo': codigos.astype(np.int16),
+            'Descrição': pd.to_numeric(df['Descrição'], errors='coerce').fillna(-1).to_numpy().astype(np.int64),
+            'Operacao_Relacionada': pd.to_numeric(df['Operacao_Relacionada'], errors='coerce').fillna(-1).to_numpy().astype(np.int64)
+        }
+        
+        self.descritor = {'tamanho': len(df), 'tipos': list(tipos), 'colunas': {}}
+        self._blocos = []
+        try:
+            for nome, array in arrays.items():
+                # Blocos de tamanho zero não são permitidos
+                bloco = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self._blocos.append(bloco)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=bloco.buf)[:] = array
+                self.descritor['colunas'][nome] = (bloco.name, array.dtype.str)
+        except Exception:
+            self.liberar()
+            raise
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, tipo_excecao, excecao, traceback):
+        self.liberar()
+    
+    def liberar(self):
+        """Fecha e remove os blocos de memória compartilhada."""
+        for bloco in self._blocos:
+            bloco.close()
+            bloco.unlink()
+        self._blocos = []
+
+def anexar_colunas(descritor):
+    """
+    Anexa aos blocos de memória compartilhada descritos por ColunasCompartilhadas.
+    
+    Returns:
+        tuple: (dict, list) - (views NumPy somente leitura por coluna, blocos abertos).
+            Os blocos devem permanecer referenciados enquanto as views forem usadas.
+    """
+    views = {}
+    blocos = []
+    for nome, (nome_bloco, dtype) in descritor['colunas'].items():
+        bloco = shared_memory.SharedMemory(name=nome_bloco)
+        view = np.ndarray((descritor['tamanho'],), dtype=np.dtype(dtype), buffer=bloco.buf)
+        view.flags.writeable = False
+        views[nome] = view
+        blocos.append(bloco)
+    return views, blocos
+
+def dividir_por_periodo(descritor, partes):
+    """
+    Divide as linhas compartilhadas em intervalos contínuos por data.
+    
+    Os cortes caem sempre na virada de um dia, para que nenhum dia fique
+    dividido entre dois intervalos.
+    
+    Returns:
+        list: Lista de tuplas (inicio, fim) com índices das linhas
+    """
+    views, blocos = anexar_colunas(descritor)
+    try:
+        dias = views['Data'] // NANOSSEGUNDOS_POR_DIA
+    finally:
+        # A divisão gera uma cópia, então as views já podem ser soltas
+        del views
+        for bloco in blocos:
+            bloco.close()
+    
+    if len(dias) == 0:
+        return [(0, 0)]
+    
+    # Recua cada corte até a primeira operação do mesmo dia
+    alvos = np.linspace(0, len(dias), partes + 1).astype(np.int64)[1:-1]
+    cortes = np.searchsorted(dias, dias[alvos], side='left')
+    limites = np.unique(np.concatenate(([0], cortes, [len(dias)])))
+    return [(int(inicio), int(fim)) for inicio, fim in zip(limites[:-1], limites[1:])]
+
+_colunas_processo = None
+
+def _inicializar_processo(descritor):
+    """Anexa as colunas compartilhadas uma única vez por processo filho."""
+    global _colunas_processo
+    _colunas_processo = anexar_colunas(descritor)
+
+def _executar_intervalo(funcao, inicio, fim):
+    """Aplica a função às fatias [inicio:fim] das colunas anexadas."""
+    views, _ = _colunas_processo
+    return funcao({nome: view[inicio:fim] for nome, view in views.items()})
+
+def executar_em_paralelo(descritor, funcao, processos=None):
+    """
+    Executa uma análise por período em vários processos, sem serializar o DataFrame.
+    
+    Cada processo anexa as colunas compartilhadas e recebe apenas os índices do
+    seu intervalo de datas. A função deve ser definida no nível do módulo e
+    receber um dict de arrays NumPy somente leitura.
+    
+    Args:
+        descritor (dict): ColunasCompartilhadas.descritor
+        funcao (callable): Análise aplicada a cada intervalo
+        processos (int): Número de processos (padrão: número de CPUs)
+        
+    Returns:
+        list: Resultados parciais, na ordem cronológica dos intervalos
+    """
+    processos = processos or os.cpu_count() or 1
+    intervalos = dividir_por_periodo(descritor, processos)
+    
+    with ProcessPoolExecutor(max_workers=processos, initializer=_inicializar_processo, initargs=(descritor,)) as executor:
+        futuros = [executor.submit(_executar_intervalo, funcao, inicio, fim) for inicio, fim in intervalos]
+        return [futuro.result() for futuro in futuros]
+
+def somar_centavos_por_tipo(colunas):
+    """
+    Soma os valores (em centavos) por código de tipo em um intervalo.
+    """
+    validos = colunas['Tipo'] >= 0
+    return np.bincount(colunas['Tipo'][validos], weights=colunas['Valor'][validos])
+
+def somar_por_tipo_paralelo(df, processos=None):
+    """
+    Calcula o total por tipo de operação dividindo as linhas entre processos.
+    
+    Returns:
+        dict: Total em reais por tipo de operação
+    """
+    with ColunasCompartilhadas(df) as colunas:
+        tipos = colunas.descritor['tipos']
+        totais = np.zeros(len(tipos))
+        for parcial in executar_em_paralelo(colunas.descritor, somar_centavos_por_tipo, processos):
+            totais[:len(parcial)] += parcial
+    return {tipo: float(total) / 100 for tipo, total in zip(tipos, totais)}
+
 def processar_relatorio(caminho_arquivo=None):
     """
     Processa o relatório financeiro.
@@ -256,19 +897,7 @@ def processar_relatorio(caminho_arquivo=None):
 
     try:
         # Lê o arquivo Excel
-        df = pd.read_excel(caminho_arquivo)
-        
-        # Renomeia as colunas para facilitar o acesso
-        df = df.rename(columns={
-            'Data de pagamento': 'Data',
-            'Tipo de operação': 'Tipo',
-            'Número do movimento': 'Descrição',
-            'Operação relacionada': 'Operacao_Relacionada',
-            'Valor': 'Valor'
-        })
-        
-        # Converte a coluna de data para datetime
-        df['Data'] = pd.to_datetime(df['Data'])
+        df = carregar_relatorio(caminho_arquivo)
         
         while True:
             limpar_tela()
@@ -282,22 +911,26 @@ def processar_relatorio(caminho_arquivo=None):
                 novo_arquivo = selecionar_arquivo()
                 if novo_arquivo:
                     caminho_arquivo = novo_arquivo
-                    df = pd.read_excel(caminho_arquivo)
-                    df = df.rename(columns={
-                        'Data de pagamento': 'Data',
-                        'Tipo de operação': 'Tipo',
-                        'Número do movimento': 'Descrição',
-                        'Operação relacionada': 'Operacao_Relacionada',
-                        'Valor': 'Valor'
-                    })
-                    df['Data'] = pd.to_datetime(df['Data'])
+                    df = carregar_relatorio(caminho_arquivo)
             elif opcao == '2':
                 gerar_analise_recebimentos_tarifas(df)
             elif opcao == '3':
                 gerar_detalhes_por_tipo(df)
             elif opcao == '4':
-                analisar_entradas_maiores(df)
+                paginar_resultados(obter_entradas_maiores(df), formatar_entrada_maior, "=== ENTRADAS MAIORES QUE R$ 59,00 ===")
+                continue
             elif opcao == '5':
+                gerar_auditoria_tarifas(df)
+            elif opcao == '6':
+                fluxo = calcular_fluxo_diario(df)
+                paginar_resultados(fluxo.reset_index(), formatar_dia_fluxo, "=== FLUXO DE CAIXA DIÁRIO ===", coluna_valor='Liquido', colunas_busca=(), valor_absoluto=False)
+                
+                if input("\nExportar fluxo diário para CSV? (s/n): ").strip().lower() == 's':
+                    data_atual = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    caminho_csv = os.path.join("reports", f"fluxo_diario_{data_atual}.csv")
+                    exportar_fluxo_diario(fluxo, caminho_csv)
+                    print(f"\nFluxo diário salvo em: {caminho_csv}")
+            elif opcao == '7':
                 # Gera nome do arquivo baseado na data atual
                 data_atual = datetime.now().strftime("%Y%m%d_%H%M%S")
                 nome_arquivo = f"relatorio_completo_{data_atual}.txt"
@@ -312,6 +945,10 @@ def processar_relatorio(caminho_arquivo=None):
                     gerar_detalhes_por_tipo(df, f)
                     f.write("\n" + "="*50 + "\n\n")
                     analisar_entradas_maiores(df, f)
+                    f.write("\n" + "="*50 + "\n\n")
+                    gerar_auditoria_tarifas(df, f)
+                    f.write("\n" + "="*50 + "\n\n")
+                    gerar_fluxo_caixa_diario(df, f)
                 
                 print(f"\nRelatório completo salvo em: {caminho_completo}")
             else:
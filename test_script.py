@@ -0,0 +1,165 @@
+import io
+import os
+
+import numpy as np
+import pandas as pd
+
+import script
+
+
+def extrato_exemplo():
+    return pd.DataFrame({
+        'Data de pagamento': pd.to_datetime([
+            '2025-06-03 10:00', '2025-06-03 10:01', '2025-06-04 09:00',
+            '2025-06-05 12:00', '2025-06-05 12:01', '2025-06-06 08:00'
+        ]),
+        'Tipo de operação': [
+            'Recebimento', 'Tarifa do Mercado Pago', 'Transferência via Pix',
+            'Recebimento', 'Tarifa do Mercado Pago', 'Imposto de renda'
+        ],
+        'Número do movimento': [1, 2, 3, 4, 5, 6],
+        'Operação relacionada': [10, 10, np.nan, 11, 11, np.nan],
+        'Valor': [100.0, -4.99, -30.0, 50.0, -2.50, -1.25]
+    })
+
+
+def test_carregar_relatorio_compartilhado(monkeypatch):
+    monkeypatch.setattr(pd, 'read_excel', lambda caminho: extrato_exemplo())
+    
+    with script.carregar_relatorio('extrato.xlsx', compartilhar=True) as colunas:
+        nomes_blocos = [nome for nome, _ in colunas.descritor['colunas'].values()]
+        views, blocos = script.anexar_colunas(colunas.descritor)
+        
+        assert list(views['Valor']) == [10000, -499, -3000, 5000, -250, -125]
+        assert list(views['Operacao_Relacionada']) == [10, 10, -1, 11, 11, -1]
+        assert not views['Valor'].flags.writeable
+        assert script.dividir_por_periodo(colunas.descritor, 2) == [(0, 3), (3, 6)]
+        assert len(colunas.df) == 6
+        
+        del views
+        for bloco in blocos:
+            bloco.close()
+    
+    # Os blocos são removidos ao sair do `with`
+    if os.path.isdir('/dev/shm'):
+        assert not any(os.path.exists(os.path.join('/dev/shm', nome)) for nome in nomes_blocos)
+
+
+def paginar_com_comandos(monkeypatch, resultado, comandos, **opcoes):
+    """Executa o paginador com comandos simulados e devolve as linhas exibidas em cada tela."""
+    telas = []
+    comandos = iter(comandos + ['0'])
+    monkeypatch.setattr(script, 'limpar_tela', lambda: telas.append([]))
+    monkeypatch.setattr('builtins.print', lambda texto='', *args, **kwargs: telas[-1].append(texto))
+    monkeypatch.setattr('builtins.input', lambda mensagem='': next(comandos))
+    script.paginar_resultados(resultado, lambda linha: f"{linha['Data']:%d/%m/%Y} {linha['Valor']:.2f}", "T", linhas_por_pagina=3, **opcoes)
+    return [[linha for linha in tela if linha[:2].isdigit()] for tela in telas]
+
+
+def test_paginador_salta_para_a_data_pedida(monkeypatch):
+    resultado = pd.DataFrame({
+        'Data': pd.date_range('2024-01-27', periods=7, freq='D'),
+        'Valor': [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]
+    })
+    
+    telas = paginar_com_comandos(monkeypatch, resultado, ['d', 'd 01/02/2024'], colunas_busca=())
+    
+    # Data vazia não encerra o paginador
+    assert telas[1] == telas[0]
+    assert telas[2][0] == '01/02/2024 6.00'
+
+
+def test_paginador_ordena_com_sinal(monkeypatch):
+    resultado = pd.DataFrame({
+        'Data': pd.date_range('2024-01-01', periods=4, freq='D'),
+        'Valor': [-50.0, 10.0, 40.0, -5.0]
+    })
+    
+    absoluto = paginar_com_comandos(monkeypatch, resultado, ['v'], colunas_busca=())
+    com_sinal = paginar_com_comandos(monkeypatch, resultado, ['v'], colunas_busca=(), valor_absoluto=False)
+    
+    assert [linha.split()[1] for linha in absoluto[1]] == ['-50.00', '40.00', '10.00']
+    assert [linha.split()[1] for linha in com_sinal[1]] == ['40.00', '10.00', '-5.00']
+
+
+def posicao_relativa(valores, estimativa):
+    """Fração dos valores abaixo da estimativa (posição do quantil estimado)."""
+    return np.mean(valores < estimativa)
+
+
+def test_sketch_kll_quantis_em_fluxo_e_mesclados():
+    valores = np.random.default_rng(7).lognormal(size=200_000)
+    qs = [0.1, 0.25, 0.5, 0.9, 0.99]
+    
+    em_fluxo = script.SketchKLL()
+    for lote in np.array_split(valores, 40):
+        em_fluxo.adicionar(lote)
+    
+    mesclado = script.SketchKLL()
+    mesclado.adicionar(valores[:70_000])
+    outro = script.SketchKLL()
+    outro.adicionar(valores[70_000:])
+    mesclado.mesclar(outro)
+    
+    assert em_fluxo.n == mesclado.n == len(valores)
+    for sketch in (em_fluxo, mesclado):
+        for q, estimativa in zip(qs, sketch.quantis(qs)):
+            assert abs(posicao_relativa(valores, estimativa) - q) < 0.02
+            assert abs(posicao_relativa(valores, estimativa) - posicao_relativa(valores, np.quantile(valores, q))) < 0.02
+
+
+def test_auditoria_ignora_arredondamento_de_centavos():
+    recebimentos = np.round(np.random.default_rng(3).uniform(5, 500, 2000), 2)
+    tarifas = np.round(recebimentos * 0.0499, 2)
+    # Três operações cobradas com o triplo da tarifa normal
+    tarifas[[10, 500, 1500]] *= 3
+    
+    taxas = pd.DataFrame({
+        'Data': pd.Timestamp('2025-06-03'),
+        'Recebimento': recebimentos,
+        'Tarifa': tarifas,
+        'Taxa': tarifas / recebimentos
+    })
+    sketch = script.SketchKLL()
+    sketch.adicionar(taxas['Taxa'])
+    
+    sinalizadas = script.sinalizar_taxas_fora_do_padrao(taxas, sketch)
+    
+    assert sorted(sinalizadas.index) == [10, 500, 1500]
+
+
+def test_auditoria_sem_operacoes_pareadas():
+    df = pd.DataFrame({
+        'Data': pd.to_datetime(['2025-06-03']),
+        'Tipo': ['Transferência via Pix'],
+        'Descrição': [1],
+        'Operacao_Relacionada': [np.nan],
+        'Valor': [-30.0]
+    })
+    saida = io.StringIO()
+    
+    script.gerar_auditoria_tarifas(df, saida)
+    
+    assert 'Nenhuma operação pareada' in saida.getvalue()
+    assert 'nan' not in saida.getvalue()
+
+
+def test_fluxo_diario_saidas_saldo_e_janelas_completas():
+    df = extrato_exemplo().rename(columns={
+        'Data de pagamento': 'Data',
+        'Tipo de operação': 'Tipo',
+        'Número do movimento': 'Descrição',
+        'Operação relacionada': 'Operacao_Relacionada'
+    })
+    df = pd.concat([df, df.assign(Data=df['Data'] + pd.Timedelta(days=10))], ignore_index=True)
+    
+    fluxo = script.calcular_fluxo_diario(df)
+    
+    assert len(fluxo) == 14
+    assert fluxo.loc['2025-06-04', 'Saidas'] == 30.0
+    assert fluxo.loc['2025-06-07', 'Operacoes'] == 0
+    assert np.isclose(fluxo['Saldo'].iloc[-1], df['Valor'].sum())
+    assert fluxo['Media_7d'].iloc[:6].isna().all()
+    assert np.isclose(fluxo['Media_7d'].iloc[6], fluxo['Liquido'].iloc[:7].mean())
+    assert fluxo['Media_30d'].isna().all()
+    assert 'Média 30d: -' in script.formatar_dia_fluxo(fluxo.reset_index().iloc[0])